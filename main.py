@@ -1,17 +1,73 @@
+import atexit
 import csv
+import functools
+import io
 import os
+import subprocess
+import sys
+import time
 from datetime import datetime, date, timedelta
 from colorama import init, Fore, Back, Style
 
 # Initialize colorama for Windows compatibility
 init(autoreset=True)
 
+# Bind the final ANSI escape strings once; colorama attribute lookups
+# are dict accesses and add up inside the display loops
+_FW = Fore.WHITE
+_FC = Fore.CYAN
+_FR = Fore.RED
+_FY = Fore.YELLOW
+_FG = Fore.GREEN
+_FB = Fore.BLUE
+_SB = Style.BRIGHT
+
+
+def _clear_screen():
+    """
+    Clear the terminal by writing the ANSI clear sequence directly,
+    avoiding a subprocess per menu iteration. colorama translates the
+    escape codes on Windows; fall back to the shell when stdout is not
+    a terminal.
+    """
+    if sys.stdout.isatty():
+        sys.stdout.write('\x1b[2J\x1b[H')
+        sys.stdout.flush()
+    else:
+        os.system('cls' if os.name == 'nt' else 'clear')
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date(s):
+    """
+    Parse a YYYY-MM-DD string into a date object.
+    Memoized so repeated date strings skip strptime entirely.
+    """
+    return datetime.strptime(s, '%Y-%m-%d').date()
+
+
+def _now_str(_cache=[0, '']):
+    """
+    Format the current time as 'YYYY-MM-DD HH:MM:SS', reusing the last
+    formatted string while the clock is still on the same second so
+    repeated timestamps skip strftime.
+    """
+    t = int(time.time())
+    if t != _cache[0]:
+        _cache[0] = t
+        _cache[1] = datetime.fromtimestamp(t).strftime('%Y-%m-%d %H:%M:%S')
+    return _cache[1]
+
 class TodoManager:
     """
     A comprehensive To-Do List Manager that handles task creation, modification,
     and tracking with CSV file persistence.
     """
     
+    # Shared lookup tables, built once instead of per call
+    PRIORITY_ORDER = {'High': 0, 'Medium': 1, 'Low': 2}
+    PRIORITY_COLORS = {'High': _FR, 'Medium': _FY, 'Low': _FG}
+
     def __init__(self, filename='tasks.csv'):
         """
         Initialize the TodoManager with a CSV file for data persistence.
@@ -23,6 +79,22 @@ class TodoManager:
         self.fieldnames = ['id', 'title', 'description', 'due_date', 'priority', 
                           'status', 'created_at', 'completed_at']
         self.tasks = self.load_tasks()
+        # Index tasks by ID for O(1) lookup and ID allocation, and by
+        # status/priority so the common filters avoid full scans
+        self._by_id = {task['id']: task for task in self.tasks}
+        self._next_id = max(self._by_id, default=0) + 1
+        self._by_status = {}
+        self._by_priority = {}
+        for task in self.tasks:
+            self._by_status.setdefault(task['status'], []).append(task)
+            self._by_priority.setdefault(task['priority'], []).append(task)
+        # Batch writes: mutations set the dirty flag, _flush writes once
+        self._dirty = False
+        atexit.register(self._flush)
+        # Date of the last overdue sweep; lets repeat sweeps short-circuit
+        self._last_sweep = None
+        # Cached sort order for view_all_tasks, dropped on any mutation
+        self._sorted_view = None
         self.update_overdue_tasks()
     
     def load_tasks(self):
@@ -35,41 +107,157 @@ class TodoManager:
         if not os.path.exists(self.filename):
             # Create file with headers if it doesn't exist
             with open(self.filename, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=self.fieldnames)
-                writer.writeheader()
+                writer = csv.writer(f)
+                writer.writerow(self.fieldnames)
             return []
-        
+
+        # Route large files through pandas' C parser when available;
+        # stdlib csv remains the default and the fallback
+        if os.path.getsize(self.filename) > 1_048_576:
+            tasks = self._load_tasks_pandas()
+            if tasks is not None:
+                return tasks
+
         tasks = []
         try:
             with open(self.filename, 'r', newline='') as f:
-                reader = csv.DictReader(f)
+                reader = csv.reader(f)
+                # Skip the header row; column order matches self.fieldnames
+                next(reader, None)
+                fieldnames = self.fieldnames
                 for row in reader:
+                    # Skip blank lines, as DictReader used to
+                    if not row:
+                        continue
+                    task = dict(zip(fieldnames, row))
                     # Convert ID to integer for proper sorting
-                    row['id'] = int(row['id'])
+                    task['id'] = int(task['id'])
                     # Handle None values for completed_at field
-                    if row['completed_at'] == '':
-                        row['completed_at'] = None
-                    tasks.append(row)
+                    if task['completed_at'] == '':
+                        task['completed_at'] = None
+                    # Intern the low-cardinality columns so every task
+                    # shares one object per distinct value and the hot
+                    # status/priority comparisons are pointer checks
+                    task['priority'] = sys.intern(task['priority'])
+                    task['status'] = sys.intern(task['status'])
+                    # Cache the parsed due date so hot paths skip strptime,
+                    # and normalize hand-edited unpadded dates back to the
+                    # zero-padded form the string comparisons rely on
+                    task['_due'] = _parse_date(task['due_date'])
+                    task['due_date'] = task['_due'].isoformat()
+                    # Precompute the sort rank so sorting avoids a dict
+                    # lookup per comparison
+                    task['_prank'] = self.PRIORITY_ORDER.get(task['priority'], 3)
+                    tasks.append(task)
         except Exception as e:
             print(f"{Fore.RED}Error reading tasks file: {e}")
             return []
         
         return tasks
-    
+
+    def _iter_rows(self):
+        """
+        Yield one CSV-ready tuple per task, in fieldnames order.
+        Translates a None completed_at to '' in place of copying the
+        task dict, and skips the private cached fields.
+        """
+        for task in self.tasks:
+            yield (task['id'], task['title'], task['description'],
+                   task['due_date'], task['priority'], task['status'],
+                   task['created_at'],
+                   task['completed_at'] if task['completed_at'] is not None else '')
+
+    def _load_tasks_pandas(self):
+        """
+        Load tasks via pandas' vectorized CSV parser.
+
+        Returns:
+            list or None: List of task dictionaries, or None if pandas
+            is not installed or cannot parse the file (caller falls
+            back to stdlib csv)
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            return None
+
+        try:
+            df = pd.read_csv(self.filename, dtype=str, keep_default_na=False)
+        except Exception:
+            # Let the stdlib parser have a try before giving up on the
+            # file; it decides whether the data is truly unreadable
+            return None
+
+        tasks = df.to_dict('records')
+        for task in tasks:
+            task['id'] = int(task['id'])
+            if task['completed_at'] == '':
+                task['completed_at'] = None
+            task['priority'] = sys.intern(task['priority'])
+            task['status'] = sys.intern(task['status'])
+            task['_due'] = _parse_date(task['due_date'])
+            task['due_date'] = task['_due'].isoformat()
+            task['_prank'] = self.PRIORITY_ORDER.get(task['priority'], 3)
+        return tasks
+
     def save_tasks(self):
         """
         Save all tasks to the CSV file.
         Converts None values to empty strings for CSV compatibility.
+        Writes to a temporary file and renames it over the original so
+        a crash mid-write can never leave a truncated task file.
         """
-        with open(self.filename, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=self.fieldnames)
-            writer.writeheader()
-            for task in self.tasks:
-                # Create a copy to avoid modifying the original
-                task_copy = task.copy()
-                if task_copy['completed_at'] is None:
-                    task_copy['completed_at'] = ''
-                writer.writerow(task_copy)
+        # Large task lists serialize much faster through pandas' C
+        # writer when it is available
+        if len(self.tasks) > 10_000 and self._save_tasks_pandas():
+            self._dirty = False
+            return
+
+        # Serialize everything in memory first so the file sees a single
+        # write() instead of one per row
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerow(self.fieldnames)
+        writer.writerows(self._iter_rows())
+        tmp = self.filename + '.tmp'
+        with open(tmp, 'w', newline='') as f:
+            f.write(buf.getvalue())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.filename)
+        self._dirty = False
+
+    def _save_tasks_pandas(self):
+        """
+        Save tasks via pandas' vectorized CSV writer.
+
+        Returns:
+            bool: True on success, False if pandas is not installed
+            (caller falls back to stdlib csv)
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            return False
+
+        # Same atomic write protocol as the stdlib path
+        tmp = self.filename + '.tmp'
+        with open(tmp, 'w', newline='') as f:
+            pd.DataFrame(self._iter_rows(), columns=self.fieldnames).to_csv(
+                f, index=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.filename)
+        return True
+
+    def _flush(self):
+        """
+        Write tasks to disk if there are unsaved changes.
+        Mutations only mark the manager dirty; this coalesces a burst of
+        changes into a single rewrite of the CSV file.
+        """
+        if self._dirty:
+            self.save_tasks()
     
     def get_next_id(self):
         """
@@ -78,36 +266,53 @@ class TodoManager:
         Returns:
             int: Next available ID
         """
-        if not self.tasks:
-            return 1
-        return max(task['id'] for task in self.tasks) + 1
+        return self._next_id
     
     def update_overdue_tasks(self):
         """
         Check all tasks and update their status to 'Overdue' if the due date has passed.
         Only updates tasks that are not already completed.
         """
-        today = date.today()
+        # Overdue status only changes when the calendar date rolls over:
+        # new tasks cannot be created in the past, completing or deleting
+        # a task maintains the index directly, so one sweep per day is
+        # enough and repeat calls return immediately
+        today_str = date.today().isoformat()
+        if today_str == self._last_sweep:
+            return
+        self._last_sweep = today_str
         updated = False
-        
+
         for task in self.tasks:
             # Skip completed tasks
             if task['status'] != 'Completed':
-                due_date = datetime.strptime(task['due_date'], '%Y-%m-%d').date()
-                if due_date < today:
+                if task['due_date'] < today_str:
                     # Mark as overdue if past due date
                     if task['status'] != 'Overdue':
-                        task['status'] = 'Overdue'
+                        self._change_status(task, 'Overdue')
                         updated = True
                 elif task['status'] == 'Overdue':
                     # Reset status if date was changed to future
-                    task['status'] = 'Pending'
+                    self._change_status(task, 'Pending')
                     updated = True
         
-        # Save only if changes were made
+        # Mark for saving only if changes were made
         if updated:
-            self.save_tasks()
+            self._dirty = True
     
+    def _change_status(self, task, new_status):
+        """
+        Set a task's status while keeping the status index in sync.
+
+        Args:
+            task (dict): The task to update
+            new_status (str): The new status value
+        """
+        self._by_status.get(task['status'], []).remove(task)
+        task['status'] = new_status
+        self._by_status.setdefault(new_status, []).append(task)
+        self._sorted_view = None
+
     def print_header(self, text):
         """
         Print a styled header with consistent formatting.
@@ -142,7 +347,7 @@ class TodoManager:
         while True:
             due_date_str = input(f"{Fore.YELLOW}Enter due date (YYYY-MM-DD): {Style.RESET_ALL}").strip()
             try:
-                due_date = datetime.strptime(due_date_str, '%Y-%m-%d').date()
+                due_date = _parse_date(due_date_str)
                 # Validate date is not in the past
                 if due_date < today:
                     print(f"{Fore.RED}Error: Due date cannot be in the past! Please enter today or a future date.")
@@ -179,16 +384,26 @@ class TodoManager:
             'id': self.get_next_id(),
             'title': title,
             'description': description,
-            'due_date': due_date_str,
+            # Store the normalized form: the string comparisons used on
+            # hot paths rely on zero-padded YYYY-MM-DD, while strptime
+            # above also accepts unpadded input like 2026-9-5
+            'due_date': due_date.isoformat(),
             'priority': priority,
             'status': 'Pending',
-            'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'completed_at': None
+            'created_at': _now_str(),
+            'completed_at': None,
+            '_due': due_date,  # cached parse, kept in sync with due_date
+            '_prank': self.PRIORITY_ORDER.get(priority, 3)
         }
         
-        # Add task and save
+        # Add task and update indexes; written out on the next flush
         self.tasks.append(task)
-        self.save_tasks()
+        self._by_id[task['id']] = task
+        self._next_id += 1
+        self._by_status.setdefault(task['status'], []).append(task)
+        self._by_priority.setdefault(task['priority'], []).append(task)
+        self._sorted_view = None
+        self._dirty = True
         print(f"{Fore.GREEN}{Style.BRIGHT}\n✓ Task added successfully! (ID: {task['id']})")
     
     def mark_completed(self):
@@ -228,9 +443,9 @@ class TodoManager:
             return
         
         # Mark as completed
-        task['status'] = 'Completed'
-        task['completed_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        self.save_tasks()
+        self._change_status(task, 'Completed')
+        task['completed_at'] = _now_str()
+        self._dirty = True
         print(f"{Fore.GREEN}{Style.BRIGHT}✓ Task '{task['title']}' marked as completed!")
     
     def delete_task(self):
@@ -275,7 +490,11 @@ class TodoManager:
         confirm = input(f"\n{Fore.RED}Are you sure you want to delete this task? (yes/no): {Style.RESET_ALL}").strip().lower()
         if confirm == 'yes':
             self.tasks.remove(task)
-            self.save_tasks()
+            del self._by_id[task['id']]
+            self._by_status.get(task['status'], []).remove(task)
+            self._by_priority.get(task['priority'], []).remove(task)
+            self._sorted_view = None
+            self._dirty = True
             print(f"{Fore.GREEN}{Style.BRIGHT}✓ Task deleted successfully!")
         else:
             print(f"{Fore.YELLOW}Deletion cancelled.")
@@ -290,10 +509,7 @@ class TodoManager:
         Returns:
             dict or None: Task dictionary if found, None otherwise
         """
-        for task in self.tasks:
-            if task['id'] == task_id:
-                return task
-        return None
+        return self._by_id.get(task_id)
     
     def view_all_tasks(self):
         """
@@ -308,16 +524,17 @@ class TodoManager:
         # Update overdue status before displaying
         self.update_overdue_tasks()
         
-        # Sort tasks: Overdue first, then by priority, then by due date
-        priority_order = {'High': 0, 'Medium': 1, 'Low': 2}
-        sorted_tasks = sorted(self.tasks, 
-                            key=lambda x: (
-                                0 if x['status'] == 'Overdue' else 1,
-                                priority_order.get(x['priority'], 3),
-                                x['due_date']
-                            ))
-        
-        self.display_tasks(sorted_tasks)
+        # Sort tasks: Overdue first, then by priority, then by due date.
+        # The sorted order is cached and reused until a mutation drops it
+        if self._sorted_view is None:
+            self._sorted_view = sorted(self.tasks,
+                                key=lambda x: (
+                                    0 if x['status'] == 'Overdue' else 1,
+                                    x['_prank'],
+                                    x['due_date']
+                                ))
+
+        self.display_tasks(self._sorted_view)
     
     def display_tasks(self, tasks):
         """
@@ -345,38 +562,54 @@ class TodoManager:
         
         # Calculate total width
         total_width = sum(col_widths.values()) + 5  # 5 for spacing between columns
-        
-        # Print header
-        print(f"\n{Fore.CYAN}" + "-" * total_width)
-        print(f"{Fore.WHITE}{Style.BRIGHT}"
-              f"{'ID':<{col_widths['id']}}"
-              f"{'Title':<{col_widths['title']}}"
-              f"{'Due Date':<{col_widths['due_date']}}"
-              f"{'Priority':<{col_widths['priority']}}"
-              f"{'Status':<{col_widths['status']}}"
-              f"{'Created':<{col_widths['created']}}")
-        print(f"{Fore.CYAN}" + "-" * total_width)
-        
-        # Display each task
+
+        # Build the whole table in memory and emit it with one write,
+        # instead of one print (and flush) per row
+        separator = _FC + "-" * total_width
+        out = []
+        out.append("\n" + separator)
+        out.append(f"{_FW}{_SB}"
+                   f"{'ID':<{col_widths['id']}}"
+                   f"{'Title':<{col_widths['title']}}"
+                   f"{'Due Date':<{col_widths['due_date']}}"
+                   f"{'Priority':<{col_widths['priority']}}"
+                   f"{'Status':<{col_widths['status']}}"
+                   f"{'Created':<{col_widths['created']}}")
+        out.append(separator)
+
+        # Compile the row template once; each row is then a single
+        # str.format call instead of rebuilding the alignment specs
+        row_tmpl = (f"{_FW}{{id:<{col_widths['id']}}}"
+                    f"{_FW}{{title:<{col_widths['title']}}}"
+                    f"{_FC}{{date:<{col_widths['due_date']}}}"
+                    f"{{pc}}{{pri:<{col_widths['priority']}}}"
+                    f"{{sc}}{{status:<{col_widths['status']}}}"
+                    f"{_FB}{{created:<{col_widths['created']}}}")
+
+        # Display each task, tallying summary counts in the same pass.
+        # Bind today's ordinal once; integer subtraction is cheaper than
+        # building a timedelta per row
+        today_ord = date.today().toordinal()
+        priority_colors = self.PRIORITY_COLORS
+        pending = completed = overdue = 0
         for task in tasks:
             # Determine status display and color
-            if task['status'] == 'Overdue':
-                status_color = Fore.RED
-                status_display = f"[!] {task['status']}"
-            elif task['status'] == 'Completed':
-                status_color = Fore.GREEN
-                status_display = f"[✓] {task['status']}"
+            status = task['status']
+            if status == 'Overdue':
+                overdue += 1
+                status_color = _FR
+                status_display = f"[!] {status}"
+            elif status == 'Completed':
+                completed += 1
+                status_color = _FG
+                status_display = f"[✓] {status}"
             else:
-                status_color = Fore.YELLOW
-                status_display = f"[-] {task['status']}"
-            
-            # Set priority colors
-            priority_colors = {
-                'High': Fore.RED,
-                'Medium': Fore.YELLOW,
-                'Low': Fore.GREEN
-            }
-            priority_color = priority_colors.get(task['priority'], Fore.WHITE)
+                if status == 'Pending':
+                    pending += 1
+                status_color = _FY
+                status_display = f"[-] {status}"
+
+            priority_color = priority_colors.get(task['priority'], _FW)
             
             # Truncate title if too long
             title_display = task['title']
@@ -384,9 +617,7 @@ class TodoManager:
                 title_display = title_display[:col_widths['title']-6] + '...'
             
             # Calculate days until due/overdue
-            due_date = datetime.strptime(task['due_date'], '%Y-%m-%d').date()
-            today = date.today()
-            days_diff = (due_date - today).days
+            days_diff = task['_due'].toordinal() - today_ord
             
             # Format due date display with days remaining/overdue
             if task['status'] == 'Completed':
@@ -400,26 +631,25 @@ class TodoManager:
             else:
                 date_display = f"{task['due_date']} ({days_diff}d left)"
             
-            # Print task row with proper alignment
-            print(f"{Fore.WHITE}{str(task['id']):<{col_widths['id']}}"
-                  f"{Fore.WHITE}{title_display:<{col_widths['title']}}"
-                  f"{Fore.CYAN}{date_display:<{col_widths['due_date']}}"
-                  f"{priority_color}{task['priority']:<{col_widths['priority']}}"
-                  f"{status_color}{status_display:<{col_widths['status']}}"
-                  f"{Fore.BLUE}{task['created_at']:<{col_widths['created']}}")
-        
-        print(f"{Fore.CYAN}" + "-" * total_width)
-        
-        # Display summary statistics
-        pending = len([t for t in tasks if t['status'] == 'Pending'])
-        completed = len([t for t in tasks if t['status'] == 'Completed'])
-        overdue = len([t for t in tasks if t['status'] == 'Overdue'])
-        
-        print(f"\n{Fore.WHITE}{Style.BRIGHT}Summary: "
-              f"{Fore.YELLOW}Pending: {pending}  "
-              f"{Fore.GREEN}Completed: {completed}  "
-              f"{Fore.RED}Overdue: {overdue}  "
-              f"{Fore.CYAN}Total: {len(tasks)}")
+            # Append task row with proper alignment
+            out.append(row_tmpl.format(id=task['id'],
+                                       title=title_display,
+                                       date=date_display,
+                                       pc=priority_color,
+                                       pri=task['priority'],
+                                       sc=status_color,
+                                       status=status_display,
+                                       created=task['created_at']))
+
+        out.append(separator)
+
+        # Append summary statistics gathered during the display pass
+        out.append(f"\n{_FW}{_SB}Summary: "
+                   f"{_FY}Pending: {pending}  "
+                   f"{_FG}Completed: {completed}  "
+                   f"{_FR}Overdue: {overdue}  "
+                   f"{_FC}Total: {len(tasks)}")
+        sys.stdout.write('\n'.join(out) + '\n')
     
     def filter_tasks(self):
         """
@@ -442,27 +672,29 @@ class TodoManager:
         filtered_tasks = []
         filter_name = ""
         
-        # Apply selected filter
+        # Apply selected filter; status/priority filters come straight
+        # from the maintained indexes instead of rescanning
         if choice == '1':
-            filtered_tasks = [t for t in self.tasks if t['status'] == 'Pending']
+            filtered_tasks = self._by_status.get('Pending', [])
             filter_name = "Pending Tasks"
         elif choice == '2':
-            filtered_tasks = [t for t in self.tasks if t['status'] == 'Completed']
+            filtered_tasks = self._by_status.get('Completed', [])
             filter_name = "Completed Tasks"
         elif choice == '3':
             today = date.today()
-            tomorrow = today + timedelta(days=1)
+            today_str = today.isoformat()
+            tomorrow_str = (today + timedelta(days=1)).isoformat()
             filtered_tasks = []
             for task in self.tasks:
-                task_date = datetime.strptime(task['due_date'], '%Y-%m-%d').date()
-                if task_date == today or task_date == tomorrow:
+                due = task['due_date']
+                if due == today_str or due == tomorrow_str:
                     filtered_tasks.append(task)
             filter_name = "Tasks Due Today or Tomorrow"
         elif choice == '4':
-            filtered_tasks = [t for t in self.tasks if t['status'] == 'Overdue']
+            filtered_tasks = self._by_status.get('Overdue', [])
             filter_name = "Overdue Tasks"
         elif choice == '5':
-            filtered_tasks = [t for t in self.tasks if t['priority'] == 'High']
+            filtered_tasks = self._by_priority.get('High', [])
             filter_name = "High Priority Tasks"
         else:
             print(f"{Fore.RED}Invalid choice!")
@@ -516,68 +748,81 @@ class TodoManager:
             filename += '.txt'
         
         try:
+            # Update overdue tasks before generating report
+            self.update_overdue_tasks()
+
+            # Bucketize everything in a single pass: status counts,
+            # per-priority groups, and upcoming tasks for the week
+            today = date.today()
+            today_str = today.isoformat()
+            week_str = (today + timedelta(days=7)).isoformat()
+            pending_tasks = completed_tasks = overdue_tasks = 0
+            priority_buckets = {'High': [], 'Medium': [], 'Low': []}
+            upcoming = []
+            for task in self.tasks:
+                status = task['status']
+                if status == 'Pending':
+                    pending_tasks += 1
+                    # Lexicographic range check is exact for YYYY-MM-DD
+                    if today_str <= task['due_date'] <= week_str:
+                        upcoming.append(task)
+                elif status == 'Completed':
+                    completed_tasks += 1
+                elif status == 'Overdue':
+                    overdue_tasks += 1
+                bucket = priority_buckets.get(task['priority'])
+                if bucket is not None:
+                    bucket.append(task)
+
+            # Accumulate the report in memory, then write it in one go
+            parts = []
+            parts.append("TASK SUMMARY REPORT\n")
+            parts.append("=" * 50 + "\n")
+            parts.append(f"Report generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+
+            # Statistics section
+            parts.append("STATISTICS:\n")
+            parts.append(f"Total Tasks: {len(self.tasks)}\n")
+            parts.append(f"Pending: {pending_tasks}\n")
+            parts.append(f"Completed: {completed_tasks}\n")
+            parts.append(f"Overdue: {overdue_tasks}\n\n")
+
+            # Tasks by priority
+            for priority in ['High', 'Medium', 'Low']:
+                priority_tasks = priority_buckets[priority]
+                if priority_tasks:
+                    parts.append(f"\n{priority.upper()} PRIORITY TASKS:\n")
+                    parts.append("-" * 50 + "\n")
+                    for task in priority_tasks:
+                        status = f"[{task['status']}]"
+                        parts.append(f"{status:<15} {task['title']:<30} Due: {task['due_date']}\n")
+                        if task['description']:
+                            parts.append(f"{'':>15} Description: {task['description']}\n")
+
+            # Upcoming tasks section
+            parts.append("\n\nUPCOMING TASKS (Next 7 days):\n")
+            parts.append("-" * 50 + "\n")
+            if upcoming:
+                for task in sorted(upcoming, key=lambda x: x['due_date']):
+                    parts.append(f"{task['due_date']} - {task['title']} [{task['priority']}]\n")
+            else:
+                parts.append("No upcoming tasks in the next 7 days.\n")
+
             with open(filename, 'w', encoding='utf-8') as f:
-                # Write header
-                f.write("TASK SUMMARY REPORT\n")
-                f.write("=" * 50 + "\n")
-                f.write(f"Report generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                
-                # Update overdue tasks before generating report
-                self.update_overdue_tasks()
-                
-                # Calculate statistics
-                total_tasks = len(self.tasks)
-                pending_tasks = len([t for t in self.tasks if t['status'] == 'Pending'])
-                completed_tasks = len([t for t in self.tasks if t['status'] == 'Completed'])
-                overdue_tasks = len([t for t in self.tasks if t['status'] == 'Overdue'])
-                
-                # Write statistics
-                f.write("STATISTICS:\n")
-                f.write(f"Total Tasks: {total_tasks}\n")
-                f.write(f"Pending: {pending_tasks}\n")
-                f.write(f"Completed: {completed_tasks}\n")
-                f.write(f"Overdue: {overdue_tasks}\n\n")
-                
-                # Write tasks by priority
-                for priority in ['High', 'Medium', 'Low']:
-                    priority_tasks = [t for t in self.tasks if t['priority'] == priority]
-                    if priority_tasks:
-                        f.write(f"\n{priority.upper()} PRIORITY TASKS:\n")
-                        f.write("-" * 50 + "\n")
-                        for task in priority_tasks:
-                            status = f"[{task['status']}]"
-                            f.write(f"{status:<15} {task['title']:<30} Due: {task['due_date']}\n")
-                            if task['description']:
-                                f.write(f"{'':>15} Description: {task['description']}\n")
-                
-                # Write upcoming tasks section
-                f.write("\n\nUPCOMING TASKS (Next 7 days):\n")
-                f.write("-" * 50 + "\n")
-                today = date.today()
-                week_later = today + timedelta(days=7)
-                upcoming = []
-                
-                # Find upcoming tasks
-                for task in self.tasks:
-                    if task['status'] == 'Pending':
-                        task_date = datetime.strptime(task['due_date'], '%Y-%m-%d').date()
-                        if today <= task_date <= week_later:
-                            upcoming.append(task)
-                
-                # Write upcoming tasks
-                if upcoming:
-                    for task in sorted(upcoming, key=lambda x: x['due_date']):
-                        f.write(f"{task['due_date']} - {task['title']} [{task['priority']}]\n")
-                else:
-                    f.write("No upcoming tasks in the next 7 days.\n")
-                
+                f.write(''.join(parts))
+
             print(f"{Fore.GREEN}{Style.BRIGHT}✓ Summary exported successfully to {filename}")
             
             # Offer to open the file
             open_file = input(f"\n{Fore.YELLOW}Do you want to open the file? (yes/no): {Style.RESET_ALL}").strip().lower()
             if open_file == 'yes':
-                # Open file with default system program
-                os.system(f'start {filename}' if os.name == 'nt' else f'open {filename}')
+                # Open file with default system program, without spawning
+                # a shell (no quoting issues with unusual filenames)
+                if os.name == 'nt':
+                    os.startfile(filename)
+                else:
+                    opener = 'xdg-open' if sys.platform.startswith('linux') else 'open'
+                    subprocess.Popen([opener, filename])
                 
         except Exception as e:
             print(f"{Fore.RED}Error exporting summary: {str(e)}")
@@ -598,24 +843,32 @@ class TodoManager:
             print(f"{Fore.YELLOW}No tasks yet! Start by adding your first task.")
             return
         
-        # Count tasks by status
-        pending = len([t for t in self.tasks if t['status'] == 'Pending'])
-        completed = len([t for t in self.tasks if t['status'] == 'Completed'])
-        overdue = len([t for t in self.tasks if t['status'] == 'Overdue'])
-        
-        # Count active tasks by priority
-        high = len([t for t in self.tasks if t['priority'] == 'High' and t['status'] != 'Completed'])
-        medium = len([t for t in self.tasks if t['priority'] == 'Medium' and t['status'] != 'Completed'])
-        low = len([t for t in self.tasks if t['priority'] == 'Low' and t['status'] != 'Completed'])
-        
-        # Find today's tasks
+        # Gather all statistics in a single pass: status counts, active
+        # tasks by priority, and today's tasks
         today = date.today()
+        pending = completed = overdue = 0
+        high = medium = low = 0
         today_tasks = []
         for task in self.tasks:
-            if task['status'] != 'Completed':
-                task_date = datetime.strptime(task['due_date'], '%Y-%m-%d').date()
-                if task_date == today:
-                    today_tasks.append(task)
+            status = task['status']
+            if status == 'Completed':
+                completed += 1
+                continue
+            elif status == 'Overdue':
+                overdue += 1
+            elif status == 'Pending':
+                pending += 1
+
+            priority = task['priority']
+            if priority == 'High':
+                high += 1
+            elif priority == 'Medium':
+                medium += 1
+            elif priority == 'Low':
+                low += 1
+
+            if task['_due'] == today:
+                today_tasks.append(task)
         
         # Display overview section
         print(f"\n{Fore.WHITE}{Style.BRIGHT}📊 OVERVIEW")
@@ -650,7 +903,7 @@ class TodoManager:
         Displays menu and handles user input until exit is selected.
         """
         # Clear screen and show welcome message
-        os.system('cls' if os.name == 'nt' else 'clear')
+        _clear_screen()
         
         print(f"{Fore.CYAN}{'='*60}")
         print(f"{Fore.CYAN}{'='*3} {Fore.WHITE}{Style.BRIGHT}{'SMART TO-DO LIST MANAGER'.center(52)} {Fore.CYAN}{'='*3}")
@@ -692,7 +945,8 @@ class TodoManager:
             elif choice == '8':
                 self.export_summary()
             elif choice == '9':
-                # Exit program
+                # Persist any pending changes and exit program
+                self._flush()
                 print(f"\n{Fore.GREEN}{Style.BRIGHT}Thank you for using Smart To-Do List Manager!")
                 print(f"{Fore.YELLOW}Stay organized and productive! Goodbye! 👋")
                 print(f"{Fore.CYAN}Created by Harryhunkalive 😊")
@@ -703,7 +957,7 @@ class TodoManager:
             # Pause before showing menu again
             input(f"\n{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
             # Clear screen for better user experience
-            os.system('cls' if os.name == 'nt' else 'clear')
+            _clear_screen()
 
 
 # Main program entry point